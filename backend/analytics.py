@@ -0,0 +1,243 @@
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from models import TournamentInput, Constraints, Availability
+from scheduler import compile_availability, day_of, has_entries
+
+
+def _parse_time_slot(label: str, start_date: Optional[datetime], slot_index: Dict[str, int]) -> Optional[Tuple[int, int]]:
+    """(day, slot) of a schedule time_slot label such as "2026-02-10 - Morning" or "Day 3 - Evening" """
+    day_part, _, slot_part = label.partition(" - ")
+    day = day_of(day_part, start_date)
+    if day is None or day < 0:
+        return None
+    return day, slot_index.get(slot_part.strip(), 0)
+
+
+def schedule_items(result: Dict) -> List[Dict]:
+    """The list of scheduled matches inside a generate_schedule result"""
+    for key in ("schedule", "current_round_schedule", "group_stage_schedule"):
+        if key in result:
+            return result[key]
+    return []
+
+
+def _check(violations: int) -> Dict:
+    return {"ok": violations == 0, "violations": violations}
+
+
+def analyze_schedule(data: TournamentInput, schedule: List[Dict[str, Any]]) -> Dict:
+    """Fairness and load metrics for a generated schedule.
+
+    Fixtures are integer-encoded and sorted once; every metric and constraint
+    check is then gathered in a single loop over them.
+    """
+    constraints = data.constraints if data.constraints else Constraints()
+    slots = data.time_slots if data.time_slots else ["Morning"]
+    num_slots = len(slots)
+    slot_index = {slot: i for i, slot in enumerate(slots)}
+
+    start_date = None
+    if data.start_date:
+        try:
+            start_date = datetime.strptime(data.start_date, "%Y-%m-%d")
+        except:
+            start_date = None
+
+    # Integer-encode fixtures; every distinct time_slot label is parsed only once
+    team_ids: Dict[str, int] = {team.name: i for i, team in enumerate(data.teams)}
+    venue_ids: Dict[str, int] = {venue.name: i for i, venue in enumerate(data.venues)}
+    labels: Dict[str, Optional[Tuple[int, int]]] = {}
+    fixtures = []  # (global slot, day, slot, team1, team2, venue)
+    unparsed = 0
+    for item in schedule:
+        label = item.get("time_slot", "")
+        if label not in labels:
+            labels[label] = _parse_time_slot(label, start_date, slot_index)
+        position = labels[label]
+        if position is None:
+            unparsed += 1
+            continue
+        team1, _, team2 = item.get("match", "").partition(" vs ")
+        t1 = team_ids.setdefault(team1, len(team_ids)) if team1 != "BYE" else -1
+        t2 = team_ids.setdefault(team2, len(team_ids)) if team2 != "BYE" else -1
+        v = venue_ids.setdefault(item.get("venue", ""), len(venue_ids))
+        day, slot = position
+        fixtures.append((day * num_slots + slot, day, slot, t1, t2, v))
+    fixtures.sort()
+
+    num_teams, num_venues = len(team_ids), len(venue_ids)
+    team_names = list(team_ids)
+    venue_names = list(venue_ids)
+    horizon = (fixtures[-1][1] + 1) if fixtures else 0
+
+    # Tracking structures
+    team_matches = [0] * num_teams
+    team_last_day = [None] * num_teams
+    team_last_slot = [None] * num_teams
+    team_day_matches = [0] * num_teams  # Matches on team_last_day
+    team_rest_min: List[Optional[int]] = [None] * num_teams
+    team_rest_total = [0] * num_teams
+    team_rest_count = [0] * num_teams  # Gaps between match days
+    team_same_day = [0] * num_teams  # Extra matches on a day the team already played
+    rest_distribution = Counter()
+    venue_matches = [0] * num_venues
+    venue_last_day = [None] * num_venues
+    venue_last_slot = [None] * num_venues
+    matches_per_day = [0] * horizon
+    matches_per_cell = [0] * (horizon * num_slots)
+    matchup_last_day: Dict[Tuple[int, int], int] = {}
+    matchup_min_gap: Dict[Tuple[int, int], int] = {}
+
+    # Availability: blackout dates and per-team / per-venue calendars, one row per slot
+    blackout = compile_availability(Availability(dates=constraints.blackout_dates), start_date, slots, horizon)
+    team_calendars = {team_ids[team.name]: compile_availability(team.unavailable, start_date, slots, horizon)
+                      for team in data.teams if has_entries(team.unavailable)}
+    venue_calendars = {venue_ids[venue.name]: compile_availability(venue.unavailable, start_date, slots, horizon)
+                       for venue in data.venues if has_entries(venue.unavailable)}
+
+    violations = Counter()
+    priority = {tuple(sorted(pair[:2])) for pair in constraints.priority_matches if len(pair) >= 2}
+    first_regular = None
+    late_priority = 0
+
+    for global_slot, day, slot, t1, t2, v in fixtures:
+        matches_per_day[day] += 1
+        matches_per_cell[global_slot] += 1
+        # Fixtures are sorted by slot, so a venue's double booking is always back to back
+        if venue_last_slot[v] == global_slot:
+            violations["venue_clashes"] += 1
+        venue_last_slot[v] = global_slot
+        if day < len(blackout[slot]) and blackout[slot][day]:
+            violations["blackout_dates"] += 1
+        if v in venue_calendars and day < len(venue_calendars[v][slot]) and venue_calendars[v][slot][day]:
+            violations["venue_availability"] += 1
+
+        for t in (t1, t2):
+            if t < 0:
+                continue
+            if t in team_calendars and day < len(team_calendars[t][slot]) and team_calendars[t][slot][day]:
+                violations["team_availability"] += 1
+            team_matches[t] += 1
+            last_day = team_last_day[t]
+            if last_day is not None:
+                if last_day == day:
+                    team_day_matches[t] += 1
+                    team_same_day[t] += 1
+                    if global_slot - team_last_slot[t] < constraints.slot_rest_gap + 1:
+                        violations["slot_rest_gap"] += 1
+                    if team_day_matches[t] > constraints.max_matches_per_team_per_day:
+                        violations["max_matches_per_team_per_day"] += 1
+                else:
+                    team_day_matches[t] = 1
+                    rest = day - last_day - 1
+                    if day - last_day < constraints.rest_gap + 1:
+                        violations["rest_gap"] += 1
+                    rest_distribution[rest] += 1
+                    team_rest_total[t] += rest
+                    team_rest_count[t] += 1
+                    if team_rest_min[t] is None or rest < team_rest_min[t]:
+                        team_rest_min[t] = rest
+                if day - last_day < constraints.min_matches_gap_same_team:
+                    violations["min_matches_gap_same_team"] += 1
+            else:
+                team_day_matches[t] = 1
+            team_last_day[t] = day
+            team_last_slot[t] = global_slot
+
+        venue_matches[v] += 1
+        if venue_last_day[v] is not None and venue_last_day[v] != day:
+            if day - venue_last_day[v] < constraints.min_venue_rest_gap + 1:
+                violations["min_venue_rest_gap"] += 1
+        venue_last_day[v] = day
+
+        if t1 >= 0 and t2 >= 0:
+            matchup = (t1, t2) if t1 < t2 else (t2, t1)
+            if matchup in matchup_last_day:
+                gap = day - matchup_last_day[matchup]
+                if gap < constraints.avoid_same_matchup_gap + 1:
+                    violations["avoid_same_matchup_gap"] += 1
+                if matchup not in matchup_min_gap or gap < matchup_min_gap[matchup]:
+                    matchup_min_gap[matchup] = gap
+            matchup_last_day[matchup] = day
+
+            if priority:
+                if tuple(sorted((team_names[t1], team_names[t2]))) in priority:
+                    if first_regular is not None and global_slot > first_regular:
+                        late_priority += 1
+                elif first_regular is None:
+                    first_regular = global_slot
+
+    # Aggregates
+    days_used = horizon
+    day_counts = [count for count in matches_per_day if count]
+    total = len(fixtures)
+    ideal_per_venue = total / num_venues if num_venues else 0
+    venue_imbalance = (max(venue_matches) - min(venue_matches)) if num_venues else 0
+    played = [count for count in team_matches if count]
+    team_imbalance = (max(played) - min(played)) if played else 0
+    day_spread = (max(day_counts) - min(day_counts)) if day_counts else 0
+
+    if constraints.max_matches_per_day:
+        violations["max_matches_per_day"] = sum(1 for count in day_counts if count > constraints.max_matches_per_day)
+    if constraints.max_matches_per_venue:
+        violations["max_matches_per_venue"] = sum(1 for count in venue_matches if count > constraints.max_matches_per_venue)
+    violations["max_concurrent_matches"] = sum(1 for count in matches_per_cell if count > constraints.max_concurrent_matches)
+
+    return {
+        "total_matches": total,
+        "unparsed_matches": unparsed,
+        "days_used": days_used,
+        "match_days": len(day_counts),
+        "matches_per_day": {
+            "min": min(day_counts) if day_counts else 0,
+            "mean": round(total / len(day_counts), 3) if day_counts else 0,
+            "max": max(day_counts) if day_counts else 0
+        },
+        "teams": {
+            team_names[t]: {
+                "matches": team_matches[t],
+                "min_rest_days": team_rest_min[t],
+                "mean_rest_days": round(team_rest_total[t] / team_rest_count[t], 3) if team_rest_count[t] else None,
+                "same_day_repeats": team_same_day[t]
+            }
+            for t in range(num_teams) if team_matches[t]
+        },
+        "rest_days_distribution": dict(sorted(rest_distribution.items())),
+        "same_day_repeats": sum(team_same_day),
+        "venues": {
+            venue_names[v]: {
+                "matches": venue_matches[v],
+                "utilisation": round(venue_matches[v] / (days_used * num_slots), 3) if days_used else 0
+            }
+            for v in range(num_venues)
+        },
+        "venue_balance": {
+            "ideal_per_venue": round(ideal_per_venue, 3),
+            "max_deviation": round(max((abs(count - ideal_per_venue) for count in venue_matches), default=0), 3),
+            "imbalance": venue_imbalance
+        },
+        "matchup_spacing": {
+            "repeated_matchups": len(matchup_min_gap),
+            "min_gap_days": min(matchup_min_gap.values(), default=None)
+        },
+        "constraint_checks": {
+            "rest_gap": _check(violations["rest_gap"]),
+            "slot_rest_gap": _check(violations["slot_rest_gap"]),
+            "max_matches_per_day": _check(violations["max_matches_per_day"]),
+            "max_matches_per_team_per_day": _check(violations["max_matches_per_team_per_day"]),
+            "min_matches_gap_same_team": _check(violations["min_matches_gap_same_team"]),
+            "min_venue_rest_gap": _check(violations["min_venue_rest_gap"]),
+            "max_matches_per_venue": _check(violations["max_matches_per_venue"]),
+            "balance_venue_usage": _check(int(constraints.balance_venue_usage and venue_imbalance > 1)),
+            "avoid_same_matchup_gap": _check(violations["avoid_same_matchup_gap"]),
+            "blackout_dates": _check(violations["blackout_dates"]),
+            "balance_matches_per_team": _check(int(constraints.balance_matches_per_team and team_imbalance > 1)),
+            "prefer_even_distribution": _check(int(constraints.prefer_even_distribution and day_spread > 1)),
+            "max_concurrent_matches": _check(violations["max_concurrent_matches"]),
+            "priority_matches": _check(late_priority),
+            "team_availability": _check(violations["team_availability"]),
+            "venue_availability": _check(violations["venue_availability"]),
+            "venue_clashes": _check(violations["venue_clashes"])
+        }
+    }
@@ -1,11 +1,20 @@
 
-from fastapi import FastAPI
+import hmac
+import os
+from typing import Optional
+from fastapi import FastAPI, Header
 from fastapi.middleware.cors import CORSMiddleware
-from models import TournamentInput, KnockoutRoundRequest, KnockoutBracketRequest
+from models import TournamentInput, KnockoutRoundRequest, KnockoutBracketRequest, SweepRequest, AnalyzeRequest
 from scheduler import generate_schedule, generate_knockout_next_round, generate_knockout_bracket
+from profiling import run_profiled, dump_request, PROFILE_MODES
+from sweep import sweep_schedule
+from analytics import analyze_schedule, schedule_items
 
 app = FastAPI(title="AI Cricket Tournament Scheduler")
 
+# Profiling and request dumps are only served to callers presenting this token
+ADMIN_TOKEN = os.environ.get("SCHEDULER_ADMIN_TOKEN")
+
 # Enable CORS
 app.add_middleware(
     CORSMiddleware,
@@ -15,30 +24,71 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+def is_admin(token: Optional[str]) -> bool:
+    return bool(ADMIN_TOKEN) and token is not None and hmac.compare_digest(token, ADMIN_TOKEN)
+
+
+def run_request(endpoint, func, request, profile: Optional[str], dump: bool, admin_token: Optional[str]):
+    """Call a scheduler entry point, optionally profiled and/or dumped for offline replay"""
+    if (profile or dump) and not is_admin(admin_token):
+        raise PermissionError("Profiling and request dumps require a valid X-Admin-Token")
+    if profile and profile not in PROFILE_MODES:
+        raise ValueError(f"Unsupported profile mode '{profile}', expected one of {', '.join(PROFILE_MODES)}")
+
+    extras = {}
+    if dump:
+        extras["replay_file"] = dump_request(endpoint, request)
+    if profile:
+        result, extras["profile"] = run_profiled(func, request, profile)
+    else:
+        result = func(request)
+    return result, extras
+
+
 @app.get("/")
 def root():
     return {"message": "AI Cricket Scheduler API is running"}
 
 @app.post("/schedule")
-def schedule_tournament(data: TournamentInput):
+def schedule_tournament(data: TournamentInput, include_stats: bool = False, profile: Optional[str] = None,
+                        dump: bool = False, x_admin_token: Optional[str] = Header(None)):
+    try:
+        schedule, extras = run_request("/schedule", generate_schedule, data, profile, dump, x_admin_token)
+        if include_stats:
+            extras["stats"] = analyze_schedule(data, schedule_items(schedule))
+        return {"schedule": schedule, **extras}
+    except (ValueError, PermissionError) as e:
+        return {"error": str(e)}
+
+@app.post("/schedule/analyze")
+def schedule_analyze(request: AnalyzeRequest):
+    try:
+        return analyze_schedule(request.tournament, request.schedule)
+    except ValueError as e:
+        return {"error": str(e)}
+
+@app.post("/schedule/sweep")
+def schedule_sweep(request: SweepRequest):
     try:
-        schedule = generate_schedule(data)
-        return {"schedule": schedule}
+        return sweep_schedule(request)
     except ValueError as e:
         return {"error": str(e)}
 
 @app.post("/knockout-bracket")
-def knockout_bracket(request: KnockoutBracketRequest):
+def knockout_bracket(request: KnockoutBracketRequest, profile: Optional[str] = None, dump: bool = False,
+                     x_admin_token: Optional[str] = Header(None)):
     try:
-        result = generate_knockout_bracket(request)
-        return result
+        result, extras = run_request("/knockout-bracket", generate_knockout_bracket, request, profile, dump, x_admin_token)
+        return {**result, **extras}
     except Exception as e:
         return {"error": str(e)}
 
 @app.post("/knockout-next-round")
-def knockout_next_round(request: KnockoutRoundRequest):
+def knockout_next_round(request: KnockoutRoundRequest, profile: Optional[str] = None, dump: bool = False,
+                        x_admin_token: Optional[str] = Header(None)):
     try:
-        result = generate_knockout_next_round(request)
-        return result
+        result, extras = run_request("/knockout-next-round", generate_knockout_next_round, request, profile, dump, x_admin_token)
+        return {**result, **extras}
     except Exception as e:
         return {"error": str(e)}
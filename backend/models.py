@@ -1,16 +1,25 @@
 
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+class Availability(BaseModel):
+    dates: List[str] = []  # "YYYY-MM-DD" for a whole day or "YYYY-MM-DD - Slot" for one slot
+    date_ranges: List[List[str]] = []  # [first, last] inclusive
+    weekdays: List[str] = []  # "Monday" ... "Sunday"
+    slots: List[str] = []  # Slots unavailable on every day
+
 class Team(BaseModel):
     name: str
+    unavailable: Availability = Availability()
 
 class Venue(BaseModel):
     name: str
+    unavailable: Availability = Availability()
 
 class Constraints(BaseModel):
     rest_gap: int = 1
+    slot_rest_gap: int = 0
     max_matches_per_day: Optional[int] = None
     max_matches_per_team_per_day: int = 1
     min_matches_gap_same_team: int = 1
@@ -31,6 +40,8 @@ class TournamentInput(BaseModel):
     time_slots: List[str]
     start_date: Optional[str] = None
     constraints: Optional[Constraints] = Constraints()
+    num_groups: int = 2
+    teams_advancing_per_group: int = 2
 
 class MatchResult(BaseModel):
     match_id: int
@@ -52,3 +63,13 @@ class KnockoutBracketRequest(BaseModel):
     time_slots: List[str]
     start_date: Optional[str] = None
     constraints: Optional[Constraints] = Constraints()
+
+class SweepRequest(BaseModel):
+    base: TournamentInput
+    grid: Dict[str, List[Any]] = {}  # Constraints field -> values to try (cartesian product)
+    venue_sets: List[List[str]] = []  # Venue names to try instead of base.venues
+    include_best_schedule: bool = False
+
+class AnalyzeRequest(BaseModel):
+    tournament: TournamentInput
+    schedule: List[Dict[str, Any]]
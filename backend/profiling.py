@@ -0,0 +1,84 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Optional, Tuple
+
+PROFILE_MODES = ("cpu", "alloc")
+REPLAY_DIR = os.environ.get("SCHEDULER_REPLAY_DIR", os.path.join(tempfile.gettempdir(), "scheduler-replays"))
+
+# tracemalloc is process-wide while requests run on threads, so alloc runs take turns
+_alloc_lock = threading.Lock()
+
+
+def _cpu_report(profiler: cProfile.Profile, top: int) -> list:
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    stats.sort_stats("cumulative")
+    report = []
+    for func in stats.fcn_list[:top]:
+        _, total_calls, total_time, cumulative_time, _ = stats.stats[func]
+        filename, line, name = func
+        report.append({
+            "function": f"{os.path.basename(filename)}:{line}({name})",
+            "calls": total_calls,
+            "total_time": round(total_time, 6),
+            "cumulative_time": round(cumulative_time, 6)
+        })
+    return report
+
+
+def _alloc_report(snapshot: tracemalloc.Snapshot, top: int) -> list:
+    report = []
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        report.append({
+            "site": f"{os.path.basename(frame.filename)}:{frame.lineno}",
+            "size_kb": round(stat.size / 1024, 2),
+            "count": stat.count
+        })
+    return report
+
+
+def run_profiled(func: Callable[[Any], Any], request: Any, mode: str, top: int = 25) -> Tuple[Any, Dict]:
+    """Run func(request) under cProfile ("cpu") or tracemalloc ("alloc")"""
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unsupported profile mode '{mode}', expected one of {', '.join(PROFILE_MODES)}")
+
+    started = time.perf_counter()
+    if mode == "cpu":
+        profiler = cProfile.Profile()
+        result = profiler.runcall(func, request)
+        report = {"mode": mode, "top_functions": _cpu_report(profiler, top)}
+    else:
+        with _alloc_lock:
+            started = time.perf_counter()
+            already_tracing = tracemalloc.is_tracing()
+            if not already_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            try:
+                result = func(request)
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                if not already_tracing:
+                    tracemalloc.stop()
+        report = {"mode": mode, "peak_kb": round(peak / 1024, 2), "top_allocations": _alloc_report(snapshot, top)}
+
+    report["wall_time"] = round(time.perf_counter() - started, 6)
+    return result, report
+
+
+def dump_request(endpoint: str, request: Any, directory: Optional[str] = None) -> str:
+    """Save a request body so it can be replayed offline with replay.py"""
+    directory = directory or REPLAY_DIR
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{endpoint.strip('/')}-{time.time_ns()}.json")
+    with open(path, "w") as f:
+        json.dump({"endpoint": endpoint, "request": request.model_dump()}, f, indent=2)
+    return path
@@ -0,0 +1,45 @@
+"""Replay a request dumped with ?dump=true against the scheduler, without the API.
+
+    python replay.py /tmp/scheduler-replays/schedule-<id>.json --profile cpu
+"""
+import argparse
+import json
+from models import TournamentInput, KnockoutRoundRequest, KnockoutBracketRequest
+from scheduler import generate_schedule, generate_knockout_next_round, generate_knockout_bracket
+from profiling import run_profiled, PROFILE_MODES
+
+ENDPOINTS = {
+    "/schedule": (TournamentInput, generate_schedule),
+    "/knockout-bracket": (KnockoutBracketRequest, generate_knockout_bracket),
+    "/knockout-next-round": (KnockoutRoundRequest, generate_knockout_next_round),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a dumped scheduler request")
+    parser.add_argument("file", help="JSON file written by ?dump=true")
+    parser.add_argument("--profile", choices=PROFILE_MODES, help="Run under cProfile (cpu) or tracemalloc (alloc)")
+    parser.add_argument("--top", type=int, default=25, help="Number of functions/allocation sites to report")
+    parser.add_argument("--quiet", action="store_true", help="Do not print the scheduler result")
+    args = parser.parse_args()
+
+    with open(args.file) as f:
+        dumped = json.load(f)
+    model, func = ENDPOINTS[dumped["endpoint"]]
+    request = model(**dumped["request"])
+
+    if args.profile:
+        result, report = run_profiled(func, request, args.profile, top=args.top)
+    else:
+        result, report = func(request), None
+
+    output = {}
+    if not args.quiet:
+        output["result"] = result
+    if report:
+        output["profile"] = report
+    print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
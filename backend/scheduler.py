@@ -1,9 +1,12 @@
 
+import heapq
 from itertools import combinations
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, Tuple, Optional
 from collections import defaultdict
-from datetime import datetime, timedelta
-from models import TournamentInput, KnockoutRoundRequest, MatchResult, KnockoutBracketRequest
+from datetime import datetime
+from models import TournamentInput, KnockoutRoundRequest, MatchResult, KnockoutBracketRequest, Constraints, Availability
+from slot_calendar import SlotCalendar
+from worker_pool import run_parallel
 
 def generate_matches(data: TournamentInput) -> List[Dict]:
     teams = [team.name for team in data.teams]
@@ -28,6 +31,10 @@ def generate_matches(data: TournamentInput) -> List[Dict]:
                 t2 = "BYE"
             matches.append({"match_id": match_id, "team1": t1, "team2": t2, "round": 1})
             match_id += 1
+    elif data.format == "groups_knockout":
+        for group, group_teams in split_into_groups(teams, data.num_groups).items():
+            for t1, t2 in combinations(group_teams, 2):
+                matches.append({"team1": t1, "team2": t2, "group": group})
     else:
         raise ValueError("Unsupported tournament format")
 
@@ -53,8 +60,13 @@ def prioritize_matches(matches: List[Dict], priority_list: List[List[str]]) -> L
     return priority_matches + regular_matches
 
 
-def generate_knockout_bracket(request: KnockoutBracketRequest) -> Dict:
-    """Generate entire knockout tournament bracket with all rounds (teams as TBD)"""
+def generate_knockout_bracket(request: KnockoutBracketRequest, calendar: Optional[SlotCalendar] = None,
+                              first_day: int = 0) -> Dict:
+    """Generate entire knockout tournament bracket with all rounds (teams as TBD).
+
+    ``calendar`` lets a caller share its request calendar, with the bracket
+    starting ``first_day`` days into it.
+    """
     num_teams = request.num_teams
     
     # Calculate number of rounds needed
@@ -63,6 +75,8 @@ def generate_knockout_bracket(request: KnockoutBracketRequest) -> Dict:
     
     all_rounds = []
     matches_per_round = num_teams // 2
+    if calendar is None:
+        calendar = SlotCalendar(request.start_date, request.time_slots)
     
     # Generate all rounds
     for round_num in range(1, num_rounds + 1):
@@ -73,18 +87,12 @@ def generate_knockout_bracket(request: KnockoutBracketRequest) -> Dict:
             # Calculate which day this match should be scheduled
             day_index = day_offset + (match_id - 1)
             venue_index = (match_id - 1) % len(request.venues)
+            slot_index = day_index if day_index < calendar.num_slots else 0
             
-            if day_index < len(request.time_slots):
-                base_slot = request.time_slots[day_index]
-            else:
-                base_slot = request.time_slots[0] if request.time_slots else "Morning"
-            
-            if request.start_date:
-                start_date = datetime.strptime(request.start_date, "%Y-%m-%d")
-                current_date = start_date + timedelta(days=day_index)
-                time_slot = f"{current_date.strftime('%Y-%m-%d')} - {base_slot}"
+            if calendar.start_date:
+                time_slot = calendar.label(first_day + day_index, slot_index)
             else:
-                time_slot = f"Round {round_num} - {base_slot}"
+                time_slot = f"Round {round_num} - {calendar.slots[slot_index]}"
             
             venue = request.venues[venue_index].name
             
@@ -157,13 +165,7 @@ def generate_knockout_next_round(request: KnockoutRoundRequest) -> Dict:
     venue_index = 0
     all_venues = [venue.name for venue in request.venues]
     
-    # Parse start date
-    start_date = None
-    if request.start_date:
-        try:
-            start_date = datetime.strptime(request.start_date, "%Y-%m-%d")
-        except:
-            start_date = None
+    calendar = SlotCalendar(request.start_date, request.time_slots)
     
     # Extract constraints
     constraints = request.constraints if request.constraints else {}
@@ -171,14 +173,8 @@ def generate_knockout_next_round(request: KnockoutRoundRequest) -> Dict:
     max_matches_per_day = constraints.max_matches_per_day if hasattr(constraints, 'max_matches_per_day') else None
     
     for match in next_matches:
-        if day_index < len(request.time_slots):
-            base_slot = request.time_slots[day_index]
-        else:
-            base_slot = request.time_slots[0] if request.time_slots else "Morning"
-        
-        if start_date:
-            current_date = start_date + timedelta(days=day_index)
-            current_slot = f"{current_date.strftime('%Y-%m-%d')} - {base_slot}"
+        if calendar.start_date:
+            current_slot = calendar.label(day_index, day_index if day_index < calendar.num_slots else 0)
         else:
             current_slot = f"Round {request.current_round + 1} - Match {match['match_id']}"
         
@@ -205,227 +201,351 @@ def generate_knockout_next_round(request: KnockoutRoundRequest) -> Dict:
     }
 
 
-def generate_schedule(data: TournamentInput) -> Dict:
-    matches = generate_matches(data)
-    constraints = data.constraints if data.constraints else {}
-    
-    # Extract constraint values with defaults
-    rest_gap = constraints.rest_gap if hasattr(constraints, 'rest_gap') else 1
-    max_matches_per_day = constraints.max_matches_per_day if hasattr(constraints, 'max_matches_per_day') else None
-    max_matches_per_team_per_day = constraints.max_matches_per_team_per_day if hasattr(constraints, 'max_matches_per_team_per_day') else 1
-    min_venue_rest_gap = constraints.min_venue_rest_gap if hasattr(constraints, 'min_venue_rest_gap') else 0
-    max_matches_per_venue = constraints.max_matches_per_venue if hasattr(constraints, 'max_matches_per_venue') else None
-    balance_venue_usage = constraints.balance_venue_usage if hasattr(constraints, 'balance_venue_usage') else True
-    avoid_same_matchup_gap = constraints.avoid_same_matchup_gap if hasattr(constraints, 'avoid_same_matchup_gap') else 4
-    blackout_dates = constraints.blackout_dates if hasattr(constraints, 'blackout_dates') else []
-    max_concurrent_matches = constraints.max_concurrent_matches if hasattr(constraints, 'max_concurrent_matches') else 3
-    priority_matches_list = constraints.priority_matches if hasattr(constraints, 'priority_matches') else []
-    
-    # Prioritize matches if specified
-    if priority_matches_list:
-        matches = prioritize_matches(matches, priority_matches_list)
-    
-    schedule = []
-    
+NEVER = -10 ** 9  # Sentinel "last played" value for teams/venues that have not been used yet
+
+
+def _lowest_bit_index(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+def _pick_venue(free_mask: int, venue_matches_count: List[int], balance_venue_usage: bool, rotation: int) -> int:
+    """Pick a venue index out of the free-venue bitmap"""
+    if balance_venue_usage:
+        # Use venue with lowest usage (lowest index wins ties)
+        best_venue = -1
+        mask = free_mask
+        while mask:
+            v = _lowest_bit_index(mask)
+            if best_venue < 0 or venue_matches_count[v] < venue_matches_count[best_venue]:
+                best_venue = v
+            mask &= mask - 1
+        return best_venue
+
+    # Use next free venue in rotation
+    num_venues = len(venue_matches_count)
+    for offset in range(num_venues):
+        v = (rotation + offset) % num_venues
+        if free_mask >> v & 1:
+            return v
+    return -1
+
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+def day_of(entry: str, start_date: Optional[datetime]) -> Optional[int]:
+    """Day index of a "YYYY-MM-DD" date (or "Day N" when there is no start date)"""
+    entry = entry.strip()
+    if start_date:
+        try:
+            return (datetime.strptime(entry, "%Y-%m-%d") - start_date).days
+        except ValueError:
+            return None
+    if entry.startswith("Day") and entry[3:].strip().isdigit():
+        return int(entry[3:].strip()) - 1
+    return None
+
+
+def has_entries(availability: Optional[Availability]) -> bool:
+    return bool(availability and (availability.dates or availability.date_ranges or availability.weekdays or availability.slots))
+
+
+def compile_availability(unavailable: Availability, start_date: Optional[datetime], slots: List[str], horizon: int) -> List[bytes]:
+    """Compile unavailability into one row per slot; row[d] is 1 when day d is unavailable.
+
+    Rows stop after their last unavailable day (days past the end are free)
+    and cover at most ``horizon`` days, so every check in the day loop is
+    ``d < len(row) and row[d]`` regardless of how far the schedule runs.
+    """
+    day_entries = []  # (first, last) day spans blocked in every slot
+    slot_entries = []  # (slot, day) blocked in one slot only
+
+    for entry in unavailable.dates:
+        day_part, _, slot_part = entry.partition(" - ")
+        day = day_of(day_part, start_date)
+        if day is None or not 0 <= day < horizon:
+            continue
+        if slot_part:
+            for s, slot in enumerate(slots):
+                if slot == slot_part.strip():
+                    slot_entries.append((s, day))
+        else:
+            day_entries.append((day, day))
+
+    for date_range in unavailable.date_ranges:
+        if len(date_range) != 2:
+            raise ValueError(f"Date range {date_range} must be [first, last]")
+        first, last = day_of(date_range[0], start_date), day_of(date_range[1], start_date)
+        if first is None or last is None:
+            continue
+        first, last = max(first, 0), min(last, horizon - 1)
+        if first <= last:
+            day_entries.append((first, last))
+
+    if unavailable.weekdays and not start_date:
+        raise ValueError("Weekday availability needs a start_date")
+    weekday_offsets = []
+    for name in unavailable.weekdays:
+        if name.lower() not in WEEKDAYS:
+            raise ValueError(f"Unknown weekday '{name}'")
+        weekday_offsets.append((WEEKDAYS.index(name.lower()) - start_date.weekday()) % 7)
+
+    # Rows only need to reach the last blocked day; weekdays repeat up to the horizon
+    length = max([last + 1 for _, last in day_entries] + [day + 1 for _, day in slot_entries], default=0)
+    if weekday_offsets:
+        length = horizon
+
+    day_row = bytearray(length)
+    for first, last in day_entries:
+        day_row[first:last + 1] = b"\x01" * (last - first + 1)
+    for first in weekday_offsets:
+        day_row[first::7] = b"\x01" * len(range(first, length, 7))
+
+    rows = []
+    for s, slot in enumerate(slots):
+        if slot in unavailable.slots:
+            rows.append(b"\x01" * horizon)
+            continue
+        row = bytearray(day_row)
+        for entry_slot, day in slot_entries:
+            if entry_slot == s:
+                row[day] = 1
+        rows.append(bytes(row.rstrip(b"\x00")))
+    return rows
+
+
+def _compile_calendars(team_availability: Optional[Dict[str, Availability]], venue_availability: Optional[List[Availability]],
+                       team_ids: Dict[str, int], start_date: Optional[datetime], slots: List[str],
+                       horizon: int) -> Tuple[List[Tuple[int, List[bytes]]], List[Tuple[int, List[bytes]]]]:
+    """Compiled calendars for the teams and venues that have any unavailability at all"""
+    team_calendars = [
+        (team_ids[name], compile_availability(availability, start_date, slots, horizon))
+        for name, availability in (team_availability or {}).items()
+        if name in team_ids and has_entries(availability)
+    ]
+    venue_calendars = [
+        (v, compile_availability(availability, start_date, slots, horizon))
+        for v, availability in enumerate(venue_availability or [])
+        if has_entries(availability)
+    ]
+    return team_calendars, venue_calendars
+
+
+PreparedMatches = Tuple[Dict[str, int], List[Tuple[Dict, Tuple[int, ...], Tuple[str, str]]], List[Tuple[int, List[bytes]]]]
+
+
+def prepare_matches(matches: List[Dict], calendar: SlotCalendar,
+                    team_availability: Optional[Dict[str, Availability]] = None) -> PreparedMatches:
+    """Integer-encode teams and compile their calendars; reusable across constraint variants"""
+    # BYE never consumes team capacity
+    team_ids: Dict[str, int] = {}
+    match_queue = []
+    for match in matches:
+        ids = tuple(team_ids.setdefault(t, len(team_ids)) for t in (match['team1'], match['team2']) if t != "BYE")
+        matchup_key = tuple(sorted([match['team1'], match['team2']]))
+        match_queue.append((match, ids, matchup_key))
+
+    team_calendars, _ = _compile_calendars(team_availability, None, team_ids, calendar.start_date, calendar.slots,
+                                           len(matches) * 10 + 1)
+    return team_ids, match_queue, team_calendars
+
+
+def place_matches(matches: List[Dict], num_venues: int, calendar: SlotCalendar, constraints: Constraints, team_availability: Optional[Dict[str, Availability]] = None,
+                   venue_availability: Optional[List[Availability]] = None, prepared: Optional[PreparedMatches] = None
+                   ) -> Tuple[List[Tuple[Dict, int, int, int, str]], List[Dict], int]:
+    """Pack matches into (day, slot, venue) capacity cells.
+
+    Returns the placements as ``(match, day, slot, venue, time_slot)`` tuples,
+    the matches that could not be placed, and the first day left for them.
+    ``prepared`` (from ``prepare_matches``) replaces ``team_availability``.
+    """
+    num_slots = calendar.num_slots
+    max_matches_per_day = constraints.max_matches_per_day
+    max_matches_per_venue = constraints.max_matches_per_venue
+    horizon = len(matches) * 10 + 1
+
+    if prepared is None:
+        prepared = prepare_matches(matches, calendar, team_availability)
+    team_ids, match_queue, team_calendars = prepared
+
+    # Availability rows, compiled once for the whole day loop
+    _, venue_calendars = _compile_calendars(None, venue_availability, team_ids, calendar.start_date, calendar.slots, horizon)
+
     # Tracking structures
-    team_last_match_day = {}  # Last day each team played
-    team_matches_per_day = defaultdict(int)  # Matches per team per day
-    teams_playing_today = {"day": -1, "set": set()}  # Teams playing on current day
-    venue_last_used = defaultdict(lambda: -float('inf'))  # Last day each venue was used
-    venue_matches_count = defaultdict(int)  # Total matches at each venue
-    matchup_last_played = defaultdict(lambda: -float('inf'))  # Last day specific matchup played
-    
+    team_last_day = [NEVER] * len(team_ids)  # Last day each team played
+    team_last_slot = [NEVER] * len(team_ids)  # Last global slot (day * num_slots + slot) each team played
+    team_matches_today = [0] * len(team_ids)  # Matches on team_last_day
+    venue_last_day = [NEVER] * num_venues  # Last day each venue was used
+    venue_matches_count = [0] * num_venues  # Total matches at each venue
+    matchup_last_played: Dict[Tuple[str, str], int] = {}  # Last day specific matchup played
+
+    placements = []
     day_index = 0
-    venue_index = 0
-    match_queue = list(matches)
-    
-    all_venues = [venue.name for venue in data.venues]
-    
-    # Parse start date if provided
-    start_date = None
-    if data.start_date:
-        try:
-            start_date = datetime.strptime(data.start_date, "%Y-%m-%d")
-        except:
-            start_date = None
-    
+    rotation = 0
+
     while match_queue:
-        # Generate the time slot for the current day
-        if day_index < len(data.time_slots):
-            base_slot = data.time_slots[day_index]
-        else:
-            base_slot = data.time_slots[0] if data.time_slots else "Morning"
-        
-        # Create slot with actual date if start_date provided
-        current_date_str = None
-        if start_date:
-            current_date = start_date + timedelta(days=day_index)
-            current_date_str = current_date.strftime('%Y-%m-%d')
-            current_slot = f"{current_date_str} - {base_slot}"
-        else:
-            if day_index < len(data.time_slots):
-                current_slot = base_slot
-            else:
-                if "-" in base_slot:
-                    period = base_slot.split("-")[1]
-                    current_slot = f"Day{day_index + 1}-{period}"
-                else:
-                    current_slot = f"Day{day_index + 1}"
-        
-        # Skip blackout dates (check both full slot and date only)
-        is_blackout = current_slot in blackout_dates
-        if current_date_str and current_date_str in blackout_dates:
-            is_blackout = True
-        
-        if is_blackout:
+        # Prevent infinite loops
+        if day_index > len(matches) * 10:
+            break
+
+        # Skip days blacked out in every slot
+        if calendar.is_blackout(day_index):
             day_index += 1
             continue
-        
-        # Reset daily counters
-        teams_in_current_day = set()
-        day_matches = []
-        remaining_matches = []
-        venues_used_today = defaultdict(int)
-        
-        # Try to schedule matches for current day
-        for match in match_queue:
-            team1, team2 = match['team1'], match['team2']
-            
-            # Stop if max matches per day reached
-            if max_matches_per_day and len(day_matches) >= max_matches_per_day:
-                remaining_matches.append(match)
+
+        slot_labels = calendar.day_labels(day_index)
+        slot_blackout = calendar.slot_blackout[day_index]
+
+        # Venues that may host today at all (rest gap and total cap)
+        venue_day_mask = 0
+        for v in range(num_venues):
+            if max_matches_per_venue and venue_matches_count[v] >= max_matches_per_venue:
                 continue
-            
-            # Stop if max concurrent matches (venues) reached
-            if len(venues_used_today) >= max_concurrent_matches:
-                remaining_matches.append(match)
+            if day_index - venue_last_day[v] < constraints.min_venue_rest_gap + 1:
                 continue
-            
-            can_schedule = True
-            
-            # 1. Check if team already playing on current day
-            if team1 in teams_in_current_day or team2 in teams_in_current_day:
-                can_schedule = False
-            
-            # 2. Check max matches per team per day
-            if team1 in team_matches_per_day:
-                if team_matches_per_day[team1] >= max_matches_per_team_per_day:
-                    can_schedule = False
-            if team2 in team_matches_per_day and team2 != "BYE":
-                if team_matches_per_day[team2] >= max_matches_per_team_per_day:
-                    can_schedule = False
-            
-            # 3. Check rest gap constraint
-            if team1 in team_last_match_day:
-                if day_index - team_last_match_day[team1] < rest_gap + 1:
-                    can_schedule = False
-            
-            if team2 in team_last_match_day and team2 != "BYE":
-                if day_index - team_last_match_day[team2] < rest_gap + 1:
-                    can_schedule = False
-            
-            # 4. Check avoid same matchup gap
-            matchup_key = tuple(sorted([team1, team2]))
-            if matchup_key in matchup_last_played:
-                if day_index - matchup_last_played[matchup_key] < avoid_same_matchup_gap + 1:
-                    can_schedule = False
-            
-            if can_schedule:
-                # Select best venue
-                best_venue = None
-                
-                if balance_venue_usage:
-                    # Use venue with lowest usage
-                    min_usage = float('inf')
-                    for v in all_venues:
-                        current_usage = venue_matches_count[v] + venues_used_today[v]
-                        if current_usage < min_usage:
-                            min_usage = current_usage
-                            best_venue = v
-                else:
-                    # Use next venue in rotation
-                    best_venue = all_venues[venue_index % len(all_venues)]
-                
-                # Check venue constraints
-                if max_matches_per_venue and venue_matches_count[best_venue] >= max_matches_per_venue:
-                    can_schedule = False
-                
-                if day_index - venue_last_used[best_venue] < min_venue_rest_gap + 1:
-                    can_schedule = False
-                
-                if can_schedule:
-                    day_matches.append(match)
-                    venues_used_today[best_venue] += 1
-                    teams_in_current_day.add(team1)
-                    if team2 != "BYE":
-                        teams_in_current_day.add(team2)
-                    
-                    team_matches_per_day[team1] += 1
-                    if team2 != "BYE":
-                        team_matches_per_day[team2] += 1
-                    
-                    team_last_match_day[team1] = day_index
-                    if team2 != "BYE":
-                        team_last_match_day[team2] = day_index
-                    
-                    matchup_last_played[matchup_key] = day_index
-                    venue_last_used[best_venue] = day_index
-                    venue_matches_count[best_venue] += 1
-                    
-                    match['scheduled_venue'] = best_venue
-                else:
-                    remaining_matches.append(match)
-            else:
-                remaining_matches.append(match)
-        
-        # Schedule the matches for this day
-        for match in day_matches:
-            schedule_item = {
-                "match": f"{match['team1']} vs {match['team2']}",
-                "time_slot": current_slot,
-                "venue": match.get('scheduled_venue', all_venues[venue_index % len(all_venues)])
-            }
-            
-            # Add match_id and round if they exist (knockout format)
-            if 'match_id' in match:
-                schedule_item["match_id"] = match['match_id']
-            if 'round' in match:
-                schedule_item["round"] = match['round']
-            
-            schedule.append(schedule_item)
-            venue_index += 1
-        
-        # Reset daily counters for next day
-        if day_index + 1 < len(data.time_slots) or remaining_matches or day_matches:
-            team_matches_per_day.clear()
-        
-        match_queue = remaining_matches
-        
-        # Move to next day
-        if day_matches or match_queue:
-            day_index += 1
-        
-        # Prevent infinite loops
-        if day_index > len(matches) * 10:
-            # Fallback: schedule remaining matches spread across days
-            fallback_day = day_index
-            for match in match_queue:
-                # Generate proper date for fallback
-                if start_date:
-                    fallback_date = start_date + timedelta(days=fallback_day)
-                    slot_idx = fallback_day % len(data.time_slots) if data.time_slots else 0
-                    fallback_slot = f"{fallback_date.strftime('%Y-%m-%d')} - {data.time_slots[slot_idx] if data.time_slots else 'TBD'}"
-                else:
-                    fallback_slot = f"Day {fallback_day + 1}"
-                
-                schedule.append({
-                    "match": f"{match['team1']} vs {match['team2']}",
-                    "time_slot": fallback_slot,
-                    "venue": all_venues[venue_index % len(all_venues)]
-                })
-                venue_index += 1
-                fallback_day += 1  # Spread to different days
-            break
+            venue_day_mask |= 1 << v
+
+        placed = [False] * len(match_queue)
+        day_matches = 0
+
+        for slot_index, current_slot in enumerate(slot_labels):
+            if slot_blackout[slot_index]:
+                continue
+            free_mask = venue_day_mask
+            for v, rows in venue_calendars:
+                row = rows[slot_index]
+                if day_index < len(row) and row[day_index]:
+                    free_mask &= ~(1 << v)
+            capacity = min(bin(free_mask).count("1"), constraints.max_concurrent_matches)
+            if max_matches_per_day:
+                capacity = min(capacity, max_matches_per_day - day_matches)
+            if capacity <= 0:
+                continue
+
+            global_slot = day_index * num_slots + slot_index
+            slot_matches = 0
+
+            unavailable_teams = 0
+            for t, rows in team_calendars:
+                row = rows[slot_index]
+                if day_index < len(row) and row[day_index]:
+                    unavailable_teams |= 1 << t
+
+            for i, (match, ids, matchup_key) in enumerate(match_queue):
+                if placed[i]:
+                    continue
+
+                # 1. Team rest in days, per-day cap and rest in slots
+                can_schedule = True
+                for t in ids:
+                    if unavailable_teams >> t & 1:
+                        can_schedule = False
+                    elif team_last_day[t] == day_index:
+                        if team_matches_today[t] >= constraints.max_matches_per_team_per_day:
+                            can_schedule = False
+                        elif global_slot - team_last_slot[t] < constraints.slot_rest_gap + 1:
+                            can_schedule = False
+                    elif day_index - team_last_day[t] < constraints.rest_gap + 1:
+                        can_schedule = False
+                if not can_schedule:
+                    continue
+
+                # 2. Check avoid same matchup gap
+                if day_index - matchup_last_played.get(matchup_key, NEVER) < constraints.avoid_same_matchup_gap + 1:
+                    continue
+
+                v = _pick_venue(free_mask, venue_matches_count, constraints.balance_venue_usage, rotation)
+                placed[i] = True
+                free_mask &= ~(1 << v)
+                venue_last_day[v] = day_index
+                venue_matches_count[v] += 1
+                if max_matches_per_venue and venue_matches_count[v] >= max_matches_per_venue:
+                    venue_day_mask &= ~(1 << v)
+                rotation = v + 1
+
+                for t in ids:
+                    if team_last_day[t] != day_index:
+                        team_matches_today[t] = 0
+                    team_last_day[t] = day_index
+                    team_last_slot[t] = global_slot
+                    team_matches_today[t] += 1
+                matchup_last_played[matchup_key] = day_index
+
+                placements.append((match, day_index, slot_index, v, current_slot))
+
+                slot_matches += 1
+                if slot_matches >= capacity:
+                    break
+
+            day_matches += slot_matches
+
+        match_queue = [entry for entry, done in zip(match_queue, placed) if not done]
+        day_index += 1
+
+    return placements, [match for match, _, _ in match_queue], day_index
+
+
+def schedule_matches(matches: List[Dict], venues: List[str], calendar: SlotCalendar, constraints: Optional[Constraints],
+                     team_availability: Optional[Dict[str, Availability]] = None,
+                     venue_availability: Optional[List[Availability]] = None) -> List[Dict]:
+    """Schedule matches on the (day, slot, venue) grid.
+
+    Every entry of ``time_slots`` is a separate slot within each day, and every
+    venue can host one match per slot. Venue availability for a day is kept as
+    a bitmap so each slot only tests the venues that are still open.
+    ``team_availability`` (by team name) and ``venue_availability`` (by venue
+    index) are compiled into per-slot day rows before the day loop starts.
+    """
+    constraints = constraints if constraints else Constraints()
+    placements, unplaced, fallback_day = place_matches(matches, len(venues), calendar, constraints,
+                                                        team_availability, venue_availability)
+
+    schedule = []
+    for match, _, _, v, time_slot in placements:
+        schedule_item = {
+            "match": f"{match['team1']} vs {match['team2']}",
+            "time_slot": time_slot,
+            "venue": venues[v]
+        }
+
+        # Add match_id and round if they exist (knockout format)
+        if 'match_id' in match:
+            schedule_item["match_id"] = match['match_id']
+        if 'round' in match:
+            schedule_item["round"] = match['round']
+
+        schedule.append(schedule_item)
+
+    # Fallback: schedule remaining matches spread across days
+    venue_index = len(placements)
+    for match in unplaced:
+        schedule.append({
+            "match": f"{match['team1']} vs {match['team2']}",
+            "time_slot": calendar.fallback_label(fallback_day),
+            "venue": venues[venue_index % len(venues)]
+        })
+        venue_index += 1
+        fallback_day += 1  # Spread to different days
+
+    return schedule
+
+
+def generate_schedule(data: TournamentInput) -> Dict:
+    if data.format == "groups_knockout":
+        return generate_groups_knockout(data)
+
+    matches = generate_matches(data)
+    constraints = data.constraints if data.constraints else Constraints()
+
+    # Prioritize matches if specified
+    if constraints.priority_matches:
+        matches = prioritize_matches(matches, constraints.priority_matches)
+
+    calendar = SlotCalendar(data.start_date, data.time_slots, constraints.blackout_dates)
+    all_venues = [venue.name for venue in data.venues]
+    team_availability = {team.name: team.unavailable for team in data.teams}
+    venue_availability = [venue.unavailable for venue in data.venues]
+    schedule = schedule_matches(matches, all_venues, calendar, constraints, team_availability, venue_availability)
 
     # For knockout format, also generate the full bracket structure
     if data.format == "knockout":
@@ -444,17 +564,12 @@ def generate_schedule(data: TournamentInput) -> Dict:
             for match_id in range(1, matches_per_round + 1):
                 day_index = day_offset + (match_id - 1)
                 venue_index_bracket = (match_id - 1) % len(data.venues)
+                slot_index = day_index if day_index < calendar.num_slots else 0
                 
-                if day_index < len(data.time_slots):
-                    base_slot = data.time_slots[day_index]
-                else:
-                    base_slot = data.time_slots[0] if data.time_slots else "Morning"
-                
-                if start_date:
-                    current_date = start_date + timedelta(days=day_index)
-                    time_slot = f"{current_date.strftime('%Y-%m-%d')} - {base_slot}"
+                if calendar.start_date:
+                    time_slot = calendar.label(day_index, slot_index)
                 else:
-                    time_slot = f"Round {round_num} - {base_slot}"
+                    time_slot = f"Round {round_num} - {calendar.slots[slot_index]}"
                 
                 venue = data.venues[venue_index_bracket].name
                 
@@ -491,225 +606,321 @@ def generate_schedule(data: TournamentInput) -> Dict:
         }
     
     return {"schedule": schedule}
-    matches = generate_matches(data)
-    constraints = data.constraints if data.constraints else {}
-    
-    # Extract constraint values with defaults
-    rest_gap = constraints.rest_gap if hasattr(constraints, 'rest_gap') else 1
-    max_matches_per_day = constraints.max_matches_per_day if hasattr(constraints, 'max_matches_per_day') else None
-    max_matches_per_team_per_day = constraints.max_matches_per_team_per_day if hasattr(constraints, 'max_matches_per_team_per_day') else 1
-    min_venue_rest_gap = constraints.min_venue_rest_gap if hasattr(constraints, 'min_venue_rest_gap') else 0
-    max_matches_per_venue = constraints.max_matches_per_venue if hasattr(constraints, 'max_matches_per_venue') else None
-    balance_venue_usage = constraints.balance_venue_usage if hasattr(constraints, 'balance_venue_usage') else True
-    avoid_same_matchup_gap = constraints.avoid_same_matchup_gap if hasattr(constraints, 'avoid_same_matchup_gap') else 4
-    blackout_dates = constraints.blackout_dates if hasattr(constraints, 'blackout_dates') else []
-    max_concurrent_matches = constraints.max_concurrent_matches if hasattr(constraints, 'max_concurrent_matches') else 3
-    priority_matches_list = constraints.priority_matches if hasattr(constraints, 'priority_matches') else []
-    
-    # Prioritize matches if specified
-    if priority_matches_list:
-        matches = prioritize_matches(matches, priority_matches_list)
-    
-    schedule = []
-    
-    # Tracking structures
-    team_last_match_day = {}  # Last day each team played
-    team_matches_per_day = defaultdict(int)  # Matches per team per day
-    teams_playing_today = {"day": -1, "set": set()}  # Teams playing on current day
-    venue_last_used = defaultdict(lambda: -float('inf'))  # Last day each venue was used
-    venue_matches_count = defaultdict(int)  # Total matches at each venue
-    matchup_last_played = defaultdict(lambda: -float('inf'))  # Last day specific matchup played
-    
-    day_index = 0
-    venue_index = 0
-    match_queue = list(matches)
-    
-    all_venues = [venue.name for venue in data.venues]
-    
-    # Parse start date if provided
-    start_date = None
-    if data.start_date:
-        try:
-            start_date = datetime.strptime(data.start_date, "%Y-%m-%d")
-        except:
-            start_date = None
-    
-    while match_queue:
-        # Generate the time slot for the current day
-        if day_index < len(data.time_slots):
-            base_slot = data.time_slots[day_index]
-        else:
-            base_slot = data.time_slots[0] if data.time_slots else "Morning"
-        
-        # Create slot with actual date if start_date provided
-        current_date_str = None
-        if start_date:
-            current_date = start_date + timedelta(days=day_index)
-            current_date_str = current_date.strftime('%Y-%m-%d')
-            current_slot = f"{current_date_str} - {base_slot}"
-        else:
-            if day_index < len(data.time_slots):
-                current_slot = base_slot
-            else:
-                if "-" in base_slot:
-                    period = base_slot.split("-")[1]
-                    current_slot = f"Day{day_index + 1}-{period}"
-                else:
-                    current_slot = f"Day{day_index + 1}"
-        
-        # Skip blackout dates (check both full slot and date only)
-        is_blackout = current_slot in blackout_dates
-        if current_date_str and current_date_str in blackout_dates:
-            is_blackout = True
-        
-        if is_blackout:
-            day_index += 1
-            continue
-        
-        # Reset daily counters
-        teams_in_current_day = set()
-        day_matches = []
-        remaining_matches = []
-        venues_used_today = defaultdict(int)
-        
-        # Try to schedule matches for current day
-        for match in match_queue:
-            team1, team2 = match['team1'], match['team2']
-            
-            # Stop if max matches per day reached
-            if max_matches_per_day and len(day_matches) >= max_matches_per_day:
-                remaining_matches.append(match)
+
+
+GROUP_POOL_MIN_GROUPS = 8  # Below this, starting worker processes costs more than scheduling the groups
+
+
+def split_into_groups(teams: List[str], num_groups: int) -> Dict[str, List[str]]:
+    """Distribute teams across groups in seeding order (1st to Group A, 2nd to Group B, ...)"""
+    names = [f"Group {chr(65 + i)}" if i < 26 else f"Group {i + 1}" for i in range(num_groups)]
+    groups = {name: [] for name in names}
+    for i, team in enumerate(teams):
+        groups[names[i % num_groups]].append(team)
+    return groups
+
+
+GroupJob = Tuple[List[Dict], int, List[str], Constraints, Dict[str, Availability]]
+
+
+def _schedule_group(job: GroupJob) -> List[Tuple[Dict, int]]:
+    """Schedule one group's round robin on an undated calendar (process pool worker).
+
+    Only the day of each match is returned; slots and venues are assigned
+    when the groups are merged onto the shared calendar.
+    """
+    matches, num_venues, slots, constraints, team_availability = job
+    placements, unplaced, fallback_day = place_matches(matches, num_venues, SlotCalendar(None, slots), constraints,
+                                                        team_availability)
+    result = [(match, day) for match, day, _, _, _ in placements]
+    for match in unplaced:
+        result.append((match, fallback_day))
+        fallback_day += 1
+    return result
+
+
+def _run_group_jobs(jobs: List[GroupJob]) -> List[List[Tuple[Dict, int]]]:
+    if len(jobs) < GROUP_POOL_MIN_GROUPS:
+        return [_schedule_group(job) for job in jobs]
+    return run_parallel(_schedule_group, jobs)
+
+
+def _merge_group_schedules(group_results: List[List[Tuple[Dict, int]]], venues: List[str],
+                           calendar: SlotCalendar, constraints: Constraints,
+                           team_availability: Optional[Dict[str, Availability]] = None,
+                           venue_availability: Optional[List[Availability]] = None) -> Tuple[List[Dict], int]:
+    """Lay independently scheduled groups onto one shared venue/day calendar.
+
+    Groups are only ever shifted by whole days, so the team rest and matchup
+    gaps each group was scheduled with are preserved. Within the target day
+    every match takes the earliest slot that still has a venue and respects
+    the team's per-day cap and slot rest gap. Matches of a day that do not
+    fit the remaining capacity move to the next day, and the rest of their
+    group is pushed back with them. Returns the merged schedule and the last
+    day used.
+    """
+    num_venues = len(venues)
+    num_slots = calendar.num_slots
+    max_matches_per_day = constraints.max_matches_per_day
+    max_matches_per_venue = constraints.max_matches_per_venue
+    min_venue_rest_gap = constraints.min_venue_rest_gap
+    guard_day = sum(len(result) for result in group_results) * 10
+
+    # Availability rows on the shared (dated) calendar
+    team_ids: Dict[str, int] = {}
+    for result in group_results:
+        for match, _ in result:
+            for team in (match['team1'], match['team2']):
+                team_ids.setdefault(team, len(team_ids))
+    team_calendars, venue_calendars = _compile_calendars(team_availability, venue_availability, team_ids,
+                                                         calendar.start_date, calendar.slots, guard_day + 1)
+    team_calendars = dict(team_calendars)
+
+    cell_venues = defaultdict(int)  # (day, slot) -> bitmap of venues in use
+    matches_per_day = defaultdict(int)
+    venue_days = [set() for _ in range(num_venues)]  # Days each venue hosts a match
+    venue_matches_count = [0] * num_venues
+    team_days = defaultdict(set)  # Days each team plays
+    team_day_slots = defaultdict(list)  # (team, day) -> slots the team plays that day
+
+    # Bundle each group's matches by day and interleave the groups day by day
+    bundles = []
+    for g, result in enumerate(group_results):
+        by_day = defaultdict(list)
+        for match, day in result:
+            by_day[day].append(match)
+        bundles.extend((day, g, len(bundles), items) for day, items in by_day.items())
+    heapq.heapify(bundles)
+
+    def fit_bundle(day: int, items: List[Dict], rotation: int) -> Tuple[List[Tuple[Dict, int, int]], List[Dict]]:
+        """Place what fits of the bundle on this day: ([(match, slot, venue)], leftover matches)"""
+        if calendar.is_blackout(day):
+            return [], items
+
+        day_mask = 0
+        for v in range(num_venues):
+            if max_matches_per_venue and venue_matches_count[v] >= max_matches_per_venue:
                 continue
-            
-            # Stop if max concurrent matches (venues) reached
-            if len(venues_used_today) >= max_concurrent_matches:
-                remaining_matches.append(match)
+            if any(day - k in venue_days[v] or day + k in venue_days[v] for k in range(1, min_venue_rest_gap + 1)):
                 continue
-            
-            can_schedule = True
-            
-            # 1. Check if team already playing on current day
-            if team1 in teams_in_current_day or team2 in teams_in_current_day:
-                can_schedule = False
-            
-            # 2. Check max matches per team per day
-            if team1 in team_matches_per_day:
-                if team_matches_per_day[team1] >= max_matches_per_team_per_day:
-                    can_schedule = False
-            if team2 in team_matches_per_day and team2 != "BYE":
-                if team_matches_per_day[team2] >= max_matches_per_team_per_day:
-                    can_schedule = False
-            
-            # 3. Check rest gap constraint
-            if team1 in team_last_match_day:
-                if day_index - team_last_match_day[team1] < rest_gap + 1:
-                    can_schedule = False
-            
-            if team2 in team_last_match_day and team2 != "BYE":
-                if day_index - team_last_match_day[team2] < rest_gap + 1:
-                    can_schedule = False
-            
-            # 4. Check avoid same matchup gap
-            matchup_key = tuple(sorted([team1, team2]))
-            if matchup_key in matchup_last_played:
-                if day_index - matchup_last_played[matchup_key] < avoid_same_matchup_gap + 1:
-                    can_schedule = False
-            
-            if can_schedule:
-                # Select best venue
-                best_venue = None
-                
-                if balance_venue_usage:
-                    # Use venue with lowest usage
-                    min_usage = float('inf')
-                    for v in all_venues:
-                        current_usage = venue_matches_count[v] + venues_used_today[v]
-                        if current_usage < min_usage:
-                            min_usage = current_usage
-                            best_venue = v
-                else:
-                    # Use next venue in rotation
-                    best_venue = all_venues[venue_index % len(all_venues)]
-                
-                # Check venue constraints
-                if max_matches_per_venue and venue_matches_count[best_venue] >= max_matches_per_venue:
-                    can_schedule = False
-                
-                if day_index - venue_last_used[best_venue] < min_venue_rest_gap + 1:
-                    can_schedule = False
-                
-                if can_schedule:
-                    day_matches.append(match)
-                    venues_used_today[best_venue] += 1
-                    teams_in_current_day.add(team1)
-                    if team2 != "BYE":
-                        teams_in_current_day.add(team2)
-                    
-                    team_matches_per_day[team1] += 1
-                    if team2 != "BYE":
-                        team_matches_per_day[team2] += 1
-                    
-                    team_last_match_day[team1] = day_index
-                    if team2 != "BYE":
-                        team_last_match_day[team2] = day_index
-                    
-                    matchup_last_played[matchup_key] = day_index
-                    venue_last_used[best_venue] = day_index
-                    venue_matches_count[best_venue] += 1
-                    
-                    match['scheduled_venue'] = best_venue
-                else:
-                    remaining_matches.append(match)
-            else:
-                remaining_matches.append(match)
-        
-        # Schedule the matches for this day
-        for match in day_matches:
-            schedule_item = {
+            day_mask |= 1 << v
+
+        open_slots = [s for s in range(num_slots) if not calendar.is_blackout(day, s)
+                      and bin(cell_venues[(day, s)]).count("1") < constraints.max_concurrent_matches
+                      and day_mask & ~cell_venues[(day, s)]]
+        if not open_slots:
+            return [], items
+        counts = list(venue_matches_count)
+        taken = defaultdict(int)  # slot -> bitmap of venues taken by this bundle
+        team_slots = defaultdict(list)  # team -> slots it plays in this bundle
+        placed, leftover = [], []
+        for match in items:
+            if max_matches_per_day and matches_per_day[day] + len(placed) >= max_matches_per_day:
+                leftover.append(match)
+                continue
+            teams = [t for t in (match['team1'], match['team2']) if t != "BYE"]
+            # Rest is measured against the days each team actually plays after merging
+            if constraints.rest_gap and any(day - k in team_days[t] or day + k in team_days[t]
+                                            for t in teams for k in range(1, constraints.rest_gap + 1)):
+                leftover.append(match)
+                continue
+            played = [other for t in teams for other in team_day_slots.get((t, day), []) + team_slots[t]]
+            if any(len(team_day_slots.get((t, day), [])) + len(team_slots[t]) >= constraints.max_matches_per_team_per_day
+                   for t in teams):
+                leftover.append(match)
+                continue
+            team_rows = [team_calendars[team_ids[t]] for t in teams if team_ids[t] in team_calendars]
+            slot, free_mask = None, 0
+            for s in open_slots:
+                if any(abs(s - other) < constraints.slot_rest_gap + 1 for other in played):
+                    continue
+                if any(day < len(rows[s]) and rows[s][day] for rows in team_rows):
+                    continue
+                in_use = cell_venues[(day, s)] | taken[s]
+                if bin(in_use).count("1") >= constraints.max_concurrent_matches:
+                    continue
+                free_mask = day_mask & ~in_use
+                for v, rows in venue_calendars:
+                    if day < len(rows[s]) and rows[s][day]:
+                        free_mask &= ~(1 << v)
+                if free_mask:
+                    slot = s
+                    break
+            if slot is None:
+                leftover.append(match)
+                continue
+            v = _pick_venue(free_mask, counts, constraints.balance_venue_usage, rotation)
+            counts[v] += 1
+            if max_matches_per_venue and counts[v] >= max_matches_per_venue:
+                day_mask &= ~(1 << v)
+            taken[slot] |= 1 << v
+            for t in teams:
+                team_slots[t].append(slot)
+            rotation = v + 1
+            placed.append((match, slot, v))
+        return placed, leftover
+
+    offsets = [0] * len(group_results)
+    rotation = 0
+    last_day = 0
+    unplaced = []
+    merged = []
+
+    while bundles:
+        rel_day, g, seq, items = heapq.heappop(bundles)
+        day = rel_day + offsets[g]
+
+        if day > guard_day:
+            unplaced.extend((g, match) for match in items)
+            continue
+
+        placed, leftover = fit_bundle(day, items, rotation)
+        if leftover:
+            # Leftovers move to the next day and the rest of the group moves with them,
+            # so the group's later rounds keep their spacing behind them
+            offsets[g] += 1
+            heapq.heappush(bundles, (rel_day, g, seq, leftover))
+        if not placed:
+            continue
+        last_day = max(last_day, day)
+
+        slot_labels = calendar.day_labels(day)
+        for match, slot, v in placed:
+            cell_venues[(day, slot)] |= 1 << v
+            venue_days[v].add(day)
+            venue_matches_count[v] += 1
+            for team in (match['team1'], match['team2']):
+                if team != "BYE":
+                    team_days[team].add(day)
+                    team_day_slots[(team, day)].append(slot)
+            rotation = v + 1
+            merged.append((day, slot, g, {
                 "match": f"{match['team1']} vs {match['team2']}",
-                "time_slot": current_slot,
-                "venue": match.get('scheduled_venue', all_venues[venue_index % len(all_venues)])
-            }
-            
-            # Add match_id and round if they exist (knockout format)
-            if 'match_id' in match:
-                schedule_item["match_id"] = match['match_id']
-            if 'round' in match:
-                schedule_item["round"] = match['round']
-            
-            schedule.append(schedule_item)
-            venue_index += 1
-        
-        # Reset daily counters for next day
-        if day_index + 1 < len(data.time_slots) or remaining_matches or day_matches:
-            team_matches_per_day.clear()
-        
-        match_queue = remaining_matches
-        
-        # Move to next day
-        if day_matches or match_queue:
-            day_index += 1
-        
-        # Prevent infinite loops
-        if day_index > len(matches) * 10:
-            # Fallback: schedule remaining matches spread across days
-            fallback_day = day_index
-            for match in match_queue:
-                # Generate proper date for fallback
-                if start_date:
-                    fallback_date = start_date + timedelta(days=fallback_day)
-                    slot_idx = fallback_day % len(data.time_slots) if data.time_slots else 0
-                    fallback_slot = f"{fallback_date.strftime('%Y-%m-%d')} - {data.time_slots[slot_idx] if data.time_slots else 'TBD'}"
-                else:
-                    fallback_slot = f"Day {fallback_day + 1}"
-                
-                schedule.append({
-                    "match": f"{match['team1']} vs {match['team2']}",
-                    "time_slot": fallback_slot,
-                    "venue": all_venues[venue_index % len(all_venues)]
-                })
-                venue_index += 1
-                fallback_day += 1  # Spread to different days
-            break
+                "time_slot": slot_labels[slot],
+                "venue": venues[v],
+                "group": match['group']
+            }))
+        matches_per_day[day] += len(placed)
 
-    return schedule
+    # Fallback: one match per day after the group stage, venues in rotation, ignoring capacity
+    for g, match in unplaced:
+        last_day += 1
+        merged.append((last_day, 0, g, {
+            "match": f"{match['team1']} vs {match['team2']}",
+            "time_slot": calendar.fallback_label(last_day),
+            "venue": venues[rotation % num_venues],
+            "group": match['group']
+        }))
+        rotation += 1
+
+    merged.sort(key=lambda entry: (entry[0], entry[1], entry[2]))
+    return [item for _, _, _, item in merged], last_day
+
+
+def _qualifier_group(seed: str) -> Optional[str]:
+    """Group a qualifier came from ("Group A #2" -> "Group A"), None for a bye"""
+    return None if seed == "BYE" else seed.rsplit(" #", 1)[0]
+
+
+def _separate_group_pairings(pairs: List[List[str]]) -> None:
+    """Swap opponents between first-round pairs so no two teams from the same group meet.
+
+    Each clash swaps its lower seed with the nearest pair that can take it
+    without creating a new clash; a clash with no such pair is left as is.
+    """
+    def clashes(team1: str, team2: str) -> bool:
+        group = _qualifier_group(team1)
+        return group is not None and group == _qualifier_group(team2)
+
+    for i, pair in enumerate(pairs):
+        if not clashes(*pair):
+            continue
+        for j in sorted(range(len(pairs)), key=lambda j: abs(j - i)):
+            other = pairs[j]
+            if j != i and not clashes(pair[0], other[1]) and not clashes(other[0], pair[1]):
+                pair[1], other[1] = other[1], pair[1]
+                break
+
+
+def generate_groups_knockout(data: TournamentInput) -> Dict:
+    """Group stage followed by a knockout bracket seeded from the group standings.
+
+    Each group's round robin is scheduled as an independent subproblem (across
+    a process pool for large events) and the results are merged onto one
+    shared venue/day calendar.
+    """
+    teams = [team.name for team in data.teams]
+    if data.num_groups < 1 or len(teams) < data.num_groups * 2:
+        raise ValueError("Each group needs at least 2 teams")
+    groups = split_into_groups(teams, data.num_groups)
+    advancing = data.teams_advancing_per_group
+    if advancing < 1 or advancing > min(len(group_teams) for group_teams in groups.values()):
+        raise ValueError("teams_advancing_per_group must be between 1 and the smallest group size")
+    if advancing * data.num_groups < 2:
+        raise ValueError("At least 2 teams must advance to the knockout stage")
+
+    constraints = data.constraints if data.constraints else Constraints()
+    calendar = SlotCalendar(data.start_date, data.time_slots, constraints.blackout_dates)
+    all_venues = [venue.name for venue in data.venues]
+
+    matches = generate_matches(data)
+    if constraints.priority_matches:
+        matches = prioritize_matches(matches, constraints.priority_matches)
+
+    group_matches = {name: [] for name in groups}
+    for match in matches:
+        group_matches[match['group']].append(match)
+
+    # Shared-calendar constraints are applied when the groups are merged
+    group_constraints = constraints.model_copy(update={
+        "blackout_dates": [],
+        "max_matches_per_day": None,
+        "max_matches_per_venue": None,
+        "min_venue_rest_gap": 0,
+    })
+    team_availability = {team.name: team.unavailable for team in data.teams}
+    venue_availability = [venue.unavailable for venue in data.venues]
+
+    # Groups run undated, so only the daily slot restrictions can be honoured there;
+    # date ranges and weekdays are honoured by shifting the group during the merge
+    jobs = [
+        (group_matches[name], len(all_venues), calendar.slots, group_constraints,
+         {team: Availability(slots=team_availability[team].slots) for team in groups[name]})
+        for name in groups
+    ]
+    group_stage, last_day = _merge_group_schedules(_run_group_jobs(jobs), all_venues, calendar, constraints,
+                                                   team_availability, venue_availability)
+
+    # Knockout starts once every team has had its rest after the group stage
+    knockout_first_day = last_day + constraints.rest_gap + 1
+
+    qualifiers = [f"{name} #{position + 1}" for position in range(advancing) for name in groups]
+    # Pad to a full bracket; the top seeds receive the byes
+    bracket_size = 1 << (len(qualifiers) - 1).bit_length()
+    seeds = qualifiers + ["BYE"] * (bracket_size - len(qualifiers))
+    bracket = generate_knockout_bracket(KnockoutBracketRequest(
+        tournament_id="groups_knockout",
+        num_teams=bracket_size,
+        venues=data.venues,
+        time_slots=data.time_slots,
+        start_date=calendar.date(knockout_first_day),
+        constraints=constraints
+    ), calendar, knockout_first_day)
+
+    # Seed the first round: best qualifiers meet the lowest-placed ones
+    pairs = [[seeds[i], seeds[bracket_size - 1 - i]] for i in range(bracket_size // 2)]
+    _separate_group_pairings(pairs)
+    for match, (team1, team2) in zip(bracket["bracket"][0]["matches"], pairs):
+        match["team1"] = team1
+        match["team2"] = team2
+        match["match"] = f"{team1} vs {team2}"
+
+    return {
+        "format": "groups_knockout",
+        "total_teams": len(teams),
+        "groups": groups,
+        "group_stage_schedule": group_stage,
+        "qualifiers": qualifiers,
+        "total_rounds": bracket["total_rounds"],
+        "bracket": bracket["bracket"]
+    }
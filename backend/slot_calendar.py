@@ -0,0 +1,76 @@
+from datetime import datetime, date
+from typing import List, Optional
+
+
+class SlotCalendar:
+    """Day/slot label table shared by everything that schedules within one request.
+
+    Rows are appended lazily as later days are reached: each day's ordinal,
+    ISO date, slot labels and blackout flags are built once and every later
+    lookup is a list read.
+    """
+
+    def __init__(self, start_date: Optional[str], time_slots: List[str], blackout_dates: Optional[List[str]] = None):
+        self.start_date: Optional[datetime] = None
+        if start_date:
+            try:
+                self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
+            except:
+                self.start_date = None
+        self.slots = time_slots if time_slots else ["Morning"]
+        self.blackout_dates = set(blackout_dates or [])
+
+        self._first_ordinal = self.start_date.toordinal() if self.start_date else None
+        self.ordinals: List[int] = []  # Proleptic Gregorian ordinal (or day index when undated)
+        self.dates: List[Optional[str]] = []  # ISO date, None when undated
+        self.labels: List[List[str]] = []  # time_slot label per slot
+        self.slot_blackout: List[List[bool]] = []  # Blacked out per slot
+        self.day_blackout: List[bool] = []  # Blacked out in every slot
+
+    @property
+    def num_slots(self) -> int:
+        return len(self.slots)
+
+    def _extend(self, day: int):
+        for d in range(len(self.dates), day + 1):
+            if self._first_ordinal is not None:
+                ordinal = self._first_ordinal + d
+                day_key = date.fromordinal(ordinal).isoformat()
+                self.dates.append(day_key)
+            else:
+                ordinal = d
+                day_key = f"Day {d + 1}"
+                self.dates.append(None)
+            labels = [f"{day_key} - {slot}" for slot in self.slots]
+            day_off = day_key in self.blackout_dates
+            flags = [day_off or label in self.blackout_dates for label in labels]
+
+            self.ordinals.append(ordinal)
+            self.labels.append(labels)
+            self.slot_blackout.append(flags)
+            self.day_blackout.append(all(flags))
+
+    def date(self, day: int) -> Optional[str]:
+        if day >= len(self.dates):
+            self._extend(day)
+        return self.dates[day]
+
+    def day_labels(self, day: int) -> List[str]:
+        if day >= len(self.labels):
+            self._extend(day)
+        return self.labels[day]
+
+    def label(self, day: int, slot: int) -> str:
+        return self.day_labels(day)[slot]
+
+    def is_blackout(self, day: int, slot: Optional[int] = None) -> bool:
+        if day >= len(self.day_blackout):
+            self._extend(day)
+        if slot is None:
+            return self.day_blackout[day]
+        return self.slot_blackout[day][slot]
+
+    def fallback_label(self, day: int) -> str:
+        if self.start_date:
+            return self.label(day, day % self.num_slots)
+        return f"Day {day + 1}"
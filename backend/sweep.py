@@ -0,0 +1,155 @@
+import time
+from itertools import product
+from typing import Any, Dict, List, Tuple
+from models import SweepRequest, Constraints
+from scheduler import generate_matches, prioritize_matches, prepare_matches, schedule_matches, place_matches
+from slot_calendar import SlotCalendar
+from worker_pool import MAX_WORKERS, run_parallel
+
+MAX_SWEEP_VARIANTS = 500
+SWEEP_POOL_MIN_VARIANTS = 8  # Below this, starting worker processes costs more than the variants themselves
+
+
+def variant_constraints(base: Constraints, overrides: Dict[str, Any]) -> Constraints:
+    return Constraints(**{**base.model_dump(), **overrides})
+
+
+def expand_variants(request: SweepRequest) -> List[Tuple[Dict[str, Any], List[str]]]:
+    """Cartesian product of the constraint grid and the venue sets"""
+    unknown = [field for field in request.grid if field not in Constraints.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown constraint(s) in grid: {', '.join(unknown)}")
+
+    base_venues = [venue.name for venue in request.base.venues]
+    venue_sets = request.venue_sets or [base_venues]
+    for venue_set in venue_sets:
+        missing = [name for name in venue_set if name not in base_venues]
+        if missing:
+            raise ValueError(f"Venue(s) not in base tournament: {', '.join(missing)}")
+        if not venue_set:
+            raise ValueError("Venue sets cannot be empty")
+        if len(set(venue_set)) != len(venue_set):
+            raise ValueError(f"Venue set {venue_set} lists a venue more than once")
+
+    fields = list(request.grid)
+    variants = [
+        (dict(zip(fields, values)), venue_set)
+        for values in product(*(request.grid[field] for field in fields))
+        for venue_set in venue_sets
+    ]
+    if len(variants) > MAX_SWEEP_VARIANTS:
+        raise ValueError(f"Sweep has {len(variants)} variants, the limit is {MAX_SWEEP_VARIANTS}")
+
+    # Reject bad values before any variant runs
+    base_constraints = request.base.constraints if request.base.constraints else Constraints()
+    for overrides, _ in variants:
+        variant_constraints(base_constraints, overrides)
+    return variants
+
+
+def _evaluate_variant(shared: Dict[str, Any], variant: Tuple[int, Dict[str, Any], List[str]]) -> Dict:
+    """Run one variant against the shared matches and return its summary row"""
+    index, overrides, venue_names = variant
+    constraints = variant_constraints(shared["base_constraints"], overrides)
+    venues = shared["venues"]
+    venue_availability = [venues[name].unavailable for name in venue_names]
+
+    calendar = shared["calendar"]
+    if "blackout_dates" in overrides:
+        calendar = SlotCalendar(shared["start_date"], shared["time_slots"], constraints.blackout_dates)
+
+    matches, prepared = shared["matches"], shared["prepared"]
+    if "priority_matches" in overrides:
+        # Priority changes the match order, so this variant needs its own encoding
+        matches = prioritize_matches(shared["base_matches"], constraints.priority_matches)
+        prepared = prepare_matches(matches, calendar, shared["team_availability"])
+
+    started = time.perf_counter()
+    placements, unplaced, fallback_day = place_matches(
+        matches, len(venue_names), calendar, constraints, venue_availability=venue_availability, prepared=prepared
+    )
+    runtime = time.perf_counter() - started
+
+    days_used = max((day for _, day, _, _, _ in placements), default=-1) + 1
+    if unplaced:
+        days_used = fallback_day + len(unplaced)
+    venue_counts = [0] * len(venue_names)
+    for _, _, _, v, _ in placements:
+        venue_counts[v] += 1
+
+    return {
+        "variant": index,
+        "constraints": overrides,
+        "venues": venue_names,
+        "days_used": days_used,
+        "venue_balance": max(venue_counts) - min(venue_counts),
+        "fallback_triggered": bool(unplaced),
+        "runtime_ms": round(runtime * 1000, 3)
+    }
+
+
+def _evaluate_chunk(chunk: Tuple[Dict[str, Any], List[Tuple[int, Dict[str, Any], List[str]]]]) -> List[Dict]:
+    shared, variants = chunk
+    return [_evaluate_variant(shared, variant) for variant in variants]
+
+
+def _run_variants(shared: Dict[str, Any], variants: List[Tuple[int, Dict[str, Any], List[str]]]) -> List[Dict]:
+    if len(variants) < SWEEP_POOL_MIN_VARIANTS:
+        return _evaluate_chunk((shared, variants))
+    # One chunk per worker, so the shared state is sent to each worker only once
+    chunks = [(shared, variants[i::MAX_WORKERS]) for i in range(MAX_WORKERS)]
+    rows = [row for chunk_rows in run_parallel(_evaluate_chunk, chunks) for row in chunk_rows]
+    return sorted(rows, key=lambda row: row["variant"])
+
+
+def sweep_schedule(request: SweepRequest) -> Dict:
+    """Evaluate many constraint/venue variants of one tournament and rank them"""
+    data = request.base
+    if data.format not in ("round_robin", "league", "knockout"):
+        raise ValueError("Sweeps support the round_robin, league and knockout formats")
+    variants = expand_variants(request)
+
+    base_constraints = data.constraints if data.constraints else Constraints()
+    calendar = SlotCalendar(data.start_date, data.time_slots, base_constraints.blackout_dates)
+
+    # Match generation and team encoding are shared by every variant
+    base_matches = generate_matches(data)
+    matches = base_matches
+    if base_constraints.priority_matches:
+        matches = prioritize_matches(base_matches, base_constraints.priority_matches)
+    team_availability = {team.name: team.unavailable for team in data.teams}
+
+    shared = {
+        "base_constraints": base_constraints,
+        "base_matches": base_matches,
+        "matches": matches,
+        "prepared": prepare_matches(matches, calendar, team_availability),
+        "team_availability": team_availability,
+        "venues": {venue.name: venue for venue in data.venues},
+        "calendar": calendar,
+        "start_date": data.start_date,
+        "time_slots": data.time_slots,
+    }
+    results = _run_variants(shared, [(i, overrides, venues) for i, (overrides, venues) in enumerate(variants)])
+
+    # Variants that needed no fallback win, then the shortest tournament, then the most even venue usage
+    best = min(results, key=lambda row: (row["fallback_triggered"], row["days_used"], row["venue_balance"], row["variant"]))
+    response = {
+        "total_variants": len(results),
+        "best_variant": best["variant"],
+        "results": results
+    }
+
+    if request.include_best_schedule:
+        best_constraints = variant_constraints(base_constraints, best["constraints"])
+        best_matches = matches
+        if "priority_matches" in best["constraints"]:
+            best_matches = prioritize_matches(base_matches, best_constraints.priority_matches)
+        if "blackout_dates" in best["constraints"]:
+            calendar = SlotCalendar(data.start_date, data.time_slots, best_constraints.blackout_dates)
+        response["best_schedule"] = schedule_matches(
+            best_matches, best["venues"], calendar, best_constraints,
+            team_availability, [shared["venues"][name].unavailable for name in best["venues"]]
+        )
+
+    return response
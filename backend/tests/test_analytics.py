@@ -0,0 +1,61 @@
+import pytest
+
+from models import TournamentInput, Constraints
+from analytics import analyze_schedule
+
+
+def _tournament(**constraints):
+    return TournamentInput(
+        teams=[{"name": name} for name in ("A", "B", "C")],
+        venues=[{"name": "V1"}, {"name": "V2"}],
+        format="round_robin",
+        time_slots=["Morning", "Evening"],
+        start_date="2026-02-10",
+        constraints=Constraints(**constraints),
+    )
+
+
+def _fixture(match, time_slot, venue="V1"):
+    return {"match": match, "time_slot": time_slot, "venue": venue}
+
+
+def test_same_day_repeats_are_not_counted_as_rest():
+    schedule = [
+        _fixture("A vs B", "2026-02-10 - Morning"),
+        _fixture("A vs C", "2026-02-10 - Evening"),
+        _fixture("B vs C", "2026-02-11 - Morning"),
+    ]
+    report = analyze_schedule(_tournament(max_matches_per_team_per_day=2), schedule)
+
+    assert report["same_day_repeats"] == 1
+    assert report["teams"]["A"] == {"matches": 2, "min_rest_days": None, "mean_rest_days": None,
+                                    "same_day_repeats": 1}
+    # B and C play on consecutive days: rest 0, not a repeat
+    assert report["teams"]["B"]["min_rest_days"] == 0
+    assert report["teams"]["B"]["same_day_repeats"] == 0
+    assert report["rest_days_distribution"] == {0: 2}
+
+
+def test_availability_is_checked():
+    data = _tournament(blackout_dates=["2026-02-11"])
+    data.teams[0].unavailable.weekdays = ["Tuesday"]
+    data.venues[1].unavailable.dates = ["2026-02-12 - Evening"]
+    schedule = [
+        _fixture("A vs B", "2026-02-10 - Morning"),
+        _fixture("B vs C", "2026-02-11 - Morning"),
+        _fixture("A vs C", "2026-02-12 - Evening", venue="V2"),
+    ]
+    checks = analyze_schedule(data, schedule)["constraint_checks"]
+
+    assert checks["team_availability"]["violations"] == 1
+    assert checks["blackout_dates"]["violations"] == 1
+    assert checks["venue_availability"]["violations"] == 1
+
+
+def test_weekdays_need_a_start_date():
+    data = _tournament()
+    data.start_date = None
+    data.teams[0].unavailable.weekdays = ["Sunday"]
+
+    with pytest.raises(ValueError, match="start_date"):
+        analyze_schedule(data, [_fixture("A vs B", "Day 1 - Morning")])
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from models import Availability
+from scheduler import compile_availability
+
+SLOTS = ["Morning", "Evening"]
+START = datetime(2026, 2, 10)  # A Tuesday
+
+
+def _blocked(rows, slot, day):
+    return bool(day < len(rows[slot]) and rows[slot][day])
+
+
+def test_rows_stop_after_the_last_blocked_day():
+    unavailable = Availability(dates=["2026-02-11", "2026-02-13 - Evening"], date_ranges=[["2026-02-15", "2026-02-16"]])
+    rows = compile_availability(unavailable, START, SLOTS, horizon=1000)
+
+    assert [len(row) for row in rows] == [7, 7]
+    assert [day for day in range(10) if _blocked(rows, 0, day)] == [1, 5, 6]
+    assert [day for day in range(10) if _blocked(rows, 1, day)] == [1, 3, 5, 6]
+
+
+def test_weekdays_and_slots_repeat_up_to_the_horizon():
+    rows = compile_availability(Availability(weekdays=["Sunday"], slots=["Evening"]), START, SLOTS, horizon=30)
+
+    assert [day for day in range(40) if _blocked(rows, 0, day)] == [5, 12, 19, 26]
+    assert [day for day in range(40) if _blocked(rows, 1, day)] == list(range(30))
@@ -0,0 +1,110 @@
+from datetime import date
+
+from models import TournamentInput, Constraints
+from scheduler import generate_schedule, generate_matches, schedule_matches
+from slot_calendar import SlotCalendar
+
+
+def _tournament(num_teams, num_groups, **overrides):
+    fields = dict(
+        teams=[{"name": f"T{i}"} for i in range(num_teams)],
+        venues=[{"name": f"V{i}"} for i in range(4)],
+        format="groups_knockout",
+        num_groups=num_groups,
+        time_slots=["Morning", "Afternoon", "Evening"],
+        start_date="2026-02-10",
+        constraints=Constraints(max_concurrent_matches=4),
+    )
+    fields.update(overrides)
+    return TournamentInput(**fields)
+
+
+def _days_used(schedule):
+    days = [date.fromisoformat(item["time_slot"].split(" - ")[0]) for item in schedule]
+    return (max(days) - min(days)).days + 1
+
+
+def test_merged_group_stage_is_no_longer_than_joint_schedule():
+    data = _tournament(32, 8)
+    merged = generate_schedule(data)["group_stage_schedule"]
+
+    calendar = SlotCalendar(data.start_date, data.time_slots)
+    joint = schedule_matches(generate_matches(data), [v.name for v in data.venues], calendar, data.constraints)
+
+    assert len(merged) == len(joint) == 48
+    assert {item["time_slot"].split(" - ")[1] for item in merged} == {"Morning", "Afternoon", "Evening"}
+    assert _days_used(merged) <= _days_used(joint)
+
+
+def test_merged_group_stage_has_no_clashes():
+    merged = generate_schedule(_tournament(32, 8))["group_stage_schedule"]
+
+    cells = [(item["time_slot"], item["venue"]) for item in merged]
+    assert len(cells) == len(set(cells))
+
+    # Default rest_gap=1: a team never plays on consecutive days
+    last_played = {}
+    for item in sorted(merged, key=lambda item: item["time_slot"]):
+        day = date.fromisoformat(item["time_slot"].split(" - ")[0])
+        for team in item["match"].split(" vs "):
+            assert team not in last_played or (day - last_played[team]).days >= 2
+            last_played[team] = day
+
+
+def _first_round(num_groups, advancing):
+    data = _tournament(num_groups * 3, num_groups, teams_advancing_per_group=advancing,
+                       constraints=Constraints())
+    result = generate_schedule(data)
+    return result, result["bracket"][0]["matches"]
+
+
+def test_every_qualifier_enters_the_bracket():
+    for num_groups, advancing in [(3, 1), (5, 1), (3, 2), (2, 2), (4, 2), (6, 3)]:
+        result, first_round = _first_round(num_groups, advancing)
+        entrants = [team for match in first_round for team in (match["team1"], match["team2"])]
+
+        assert sorted(t for t in entrants if t != "BYE") == sorted(result["qualifiers"])
+        assert len(entrants) == 2 ** result["total_rounds"]
+        assert len(result["bracket"][-1]["matches"]) == 1
+
+
+def test_first_round_avoids_same_group_pairings():
+    for num_groups, advancing in [(3, 2), (2, 2), (4, 2), (6, 3)]:
+        _, first_round = _first_round(num_groups, advancing)
+        for match in first_round:
+            if match["team2"] != "BYE":
+                assert match["team1"].split(" #")[0] != match["team2"].split(" #")[0], match["match"]
+
+
+def test_top_seeds_receive_byes():
+    _, first_round = _first_round(3, 1)
+    assert [match["match"] for match in first_round] == ["Group A #1 vs BYE", "Group B #1 vs Group C #1"]
+
+
+def _assert_clean(data):
+    from analytics import analyze_schedule
+
+    merged = generate_schedule(data)["group_stage_schedule"]
+    checks = analyze_schedule(data, merged)["constraint_checks"]
+    for name in ("rest_gap", "max_matches_per_day", "max_matches_per_team_per_day", "venue_availability",
+                 "max_concurrent_matches", "venue_clashes"):
+        assert checks[name]["ok"], (name, checks[name])
+    return merged
+
+
+def test_day_cap_splits_group_days_instead_of_falling_back():
+    data = _tournament(16, 2, time_slots=["Morning", "Evening"], constraints=Constraints(max_matches_per_day=2))
+    merged = _assert_clean(data)
+
+    assert len(merged) == 56
+    assert _days_used(merged) == 28
+
+
+def test_unavailable_venue_is_never_booked():
+    venues = [{"name": "V0", "unavailable": {"slots": ["M"]}}] + [{"name": f"V{i}"} for i in range(1, 4)]
+    data = _tournament(16, 2, venues=venues, time_slots=["M"], constraints=Constraints())
+    merged = _assert_clean(data)
+
+    assert len(merged) == 56
+    assert "V0" not in {item["venue"] for item in merged}
+    assert _days_used(merged) < 60
@@ -0,0 +1,28 @@
+import threading
+import time
+
+from profiling import run_profiled
+
+
+def test_overlapping_alloc_runs_do_not_stop_each_other():
+    def slow(request):
+        time.sleep(request)
+        return [0] * 1000
+
+    errors, reports = [], []
+
+    def profile(delay):
+        try:
+            reports.append(run_profiled(slow, delay, "alloc")[1])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=profile, args=(delay,)) for delay in (0.05, 0.2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(reports) == 2
+    assert all(report["peak_kb"] > 0 for report in reports)
@@ -0,0 +1,28 @@
+import pytest
+
+from models import SweepRequest, TournamentInput
+from sweep import sweep_schedule
+
+
+def _request(**fields):
+    base = TournamentInput(
+        teams=[{"name": f"T{i}"} for i in range(6)],
+        venues=[{"name": f"V{i}"} for i in range(3)],
+        format="round_robin",
+        time_slots=["M"],
+        start_date="2026-02-10",
+    )
+    return SweepRequest(base=base, **fields)
+
+
+def test_duplicate_venues_in_a_set_are_rejected():
+    with pytest.raises(ValueError, match="more than once"):
+        sweep_schedule(_request(venue_sets=[["V0", "V0", "V0"]]))
+
+
+def test_sweep_ranks_every_variant():
+    result = sweep_schedule(_request(grid={"rest_gap": [0, 1, 2]}, venue_sets=[["V0"], ["V0", "V1", "V2"]]))
+
+    assert result["total_variants"] == 6
+    assert [row["variant"] for row in result["results"]] == list(range(6))
+    assert result["results"][result["best_variant"]]["venues"] == ["V0", "V1", "V2"]
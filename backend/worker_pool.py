@@ -0,0 +1,42 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Sequence
+
+# One pool for the whole server, capped so concurrent requests cannot fan out
+# into a process per core each
+MAX_WORKERS = max(1, int(os.environ.get("SCHEDULER_MAX_WORKERS", min(4, os.cpu_count() or 1))))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """The shared worker pool, started on first use.
+
+    Workers are spawned rather than forked: the API server runs requests on
+    threads, and a forked child would inherit their locks mid-use.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def run_parallel(func: Callable[[Any], Any], jobs: Sequence[Any]) -> List[Any]:
+    """Map ``func`` over ``jobs`` on the shared pool, or in this process when no pool can run"""
+    global _pool
+    if MAX_WORKERS > 1:
+        try:
+            return list(get_pool().map(func, jobs))
+        except (OSError, NotImplementedError):
+            # Some serverless runtimes cannot start worker processes
+            pass
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool on the next call
+            with _pool_lock:
+                _pool = None
+    return [func(job) for job in jobs]
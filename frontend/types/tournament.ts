@@ -1,10 +1,19 @@
 /* eslint-disable @typescript-eslint/no-explicit-any */
+export interface Availability {
+  dates?: string[];
+  date_ranges?: [string, string][];
+  weekdays?: string[];
+  slots?: string[];
+}
+
 export interface Team {
   name: string;
+  unavailable?: Availability;
 }
 
 export interface Venue {
   name: string;
+  unavailable?: Availability;
 }
 
 export interface Constraints {
@@ -21,10 +30,12 @@ export interface Constraints {
 export interface TournamentInput {
   teams: Team[];
   venues: Venue[];
-  format: 'round_robin' | 'league' | 'knockout';
+  format: 'round_robin' | 'league' | 'knockout' | 'groups_knockout';
   time_slots: string[];
   start_date: string;
   constraints?: Constraints;
+  num_groups?: number;
+  teams_advancing_per_group?: number;
 }
 
 export interface Match {